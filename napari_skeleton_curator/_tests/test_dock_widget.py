@@ -1,5 +1,9 @@
+import numpy as np
 import pytest
 
+from napari_skeleton_curator import QtSkeletonCurator
+from napari_skeleton_curator.utils import make_label_pyramid
+
 # this is your plugin name declared in your napari.plugins entry point
 MY_PLUGIN_NAME = "napari-skeleton-curator"
 # the name of your widget(s)
@@ -14,3 +18,23 @@ def test_something_with_viewer(widget_name, make_napari_viewer):
         plugin_name=MY_PLUGIN_NAME, widget_name=widget_name
     )
     assert len(viewer.window._dock_widgets) == num_dw + 1
+
+
+def test_fill_multiscale_skeleton(make_napari_viewer):
+    viewer = make_napari_viewer()
+    widget = QtSkeletonCurator(viewer)
+
+    # a skeleton with a small gap between two branches
+    skeleton_im = np.zeros((100, 100), dtype=bool)
+    skeleton_im[50, 10:45] = True
+    skeleton_im[50, 48:90] = True
+    skeleton_layer = viewer.add_labels(
+        make_label_pyramid(skeleton_im.astype(int), chunk_size=32),
+        multiscale=True,
+        name='skeletonize',
+    )
+
+    widget._on_fill(skeleton_layer)
+
+    assert viewer.layers['filled_skeleton'].data[0].shape == (100, 100)
+    assert widget.summary['filled_skeleton'].shape[0] == 1
@@ -0,0 +1,86 @@
+from napari.layers import Labels
+import numpy as np
+import pytest
+from skimage.measure import label
+
+from napari_skeleton_curator.utils import make_label_pyramid
+
+
+def _make_branches():
+    labels = np.zeros((100, 70), dtype=int)
+    # 1 px wide branches
+    labels[10, 5:60] = 1
+    labels[20:90, 33] = 2
+    return labels
+
+
+def test_make_label_pyramid():
+    labels = _make_branches()
+
+    pyramid = make_label_pyramid(labels, chunk_size=16)
+
+    assert [level.shape for level in pyramid] == [
+        (100, 70), (50, 35), (25, 18), (13, 9)
+    ]
+    np.testing.assert_array_equal(pyramid[0], labels)
+    for level in pyramid:
+        assert max(level.chunksize) <= 16
+
+    # the thin branches keep their ids and stay connected when zoomed out
+    coarsest = np.asarray(pyramid[-1])
+    for branch_id in (1, 2):
+        assert label(coarsest == branch_id).max() == 1
+    assert coarsest[1, 0] == 1
+    assert coarsest[1, 7] == 1
+    assert coarsest[2, 4] == 2
+    assert coarsest[11, 4] == 2
+    assert coarsest[12, 4] == 0
+    assert coarsest[0, 0] == 0
+
+
+def test_make_label_pyramid_store(tmp_path):
+    labels = _make_branches()
+    store = str(tmp_path / 'pyramid.zarr')
+
+    pyramid = make_label_pyramid(labels, store=store, chunk_size=16)
+    expected = make_label_pyramid(labels, chunk_size=16)
+
+    assert len(pyramid) == len(expected)
+    for level_index, (level, expected_level) in enumerate(zip(pyramid, expected)):
+        assert (tmp_path / 'pyramid.zarr' / str(level_index)).exists()
+        np.testing.assert_array_equal(level, expected_level)
+
+
+def test_make_label_pyramid_stack():
+    labels = np.zeros((3, 40, 40), dtype=int)
+    labels[1, 5, 3:30] = 4
+
+    pyramid = make_label_pyramid(labels, chunk_size=16)
+
+    # the leading axis is not downsampled
+    assert [level.shape for level in pyramid] == [
+        (3, 40, 40), (3, 20, 20), (3, 10, 10)
+    ]
+    for level in pyramid:
+        assert level.chunksize[0] == 1
+    coarsest = np.asarray(pyramid[-1])
+    assert coarsest[0].max() == 0
+    assert coarsest[2].max() == 0
+    np.testing.assert_array_equal(np.flatnonzero(coarsest[1, 1]), np.arange(8))
+
+
+def test_make_label_pyramid_single_level():
+    labels = np.zeros((10, 12), dtype=int)
+    labels[4, 2:9] = 1
+
+    pyramid = make_label_pyramid(labels, chunk_size=16)
+
+    assert len(pyramid) == 1
+    layer = Labels(pyramid, multiscale=True)
+    np.testing.assert_array_equal(layer.data[0], labels)
+
+
+@pytest.mark.parametrize('downscale', [1, 2.5])
+def test_make_label_pyramid_invalid_downscale(downscale):
+    with pytest.raises(ValueError):
+        make_label_pyramid(np.zeros((10, 10), dtype=int), downscale=downscale)
@@ -1,9 +1,17 @@
+import tempfile
+
 import magicgui
-from napari.layers import Image
+from napari.layers import Image, Labels
 import numpy as np
 from qtpy.QtWidgets import QWidget, QVBoxLayout, QPushButton
 
-from .utils import preprocess_image, make_skeleton, remove_small_branches, fill_skeleton_holes
+from .utils import (
+    preprocess_image,
+    make_skeleton,
+    remove_small_branches,
+    fill_skeleton_holes,
+    make_label_pyramid,
+)
 
 
 class QtSkeletonCurator(QWidget):
@@ -14,6 +22,10 @@ class QtSkeletonCurator(QWidget):
         self.skeleton = {}
         self.summary = {}
 
+        # the label pyramids are stored in a temporary directory that is
+        # removed with the widget
+        self._pyramid_dir = tempfile.TemporaryDirectory()
+
         # turn on toolips
         self.viewer.tooltip.visible = True
 
@@ -57,10 +69,9 @@ class QtSkeletonCurator(QWidget):
 
         # make a button to fill gaps in the skeleton
         self.fill_widget = magicgui.magicgui(
-            fill_skeleton_holes,
+            self._on_fill,
             call_button='fill skeleton'
         )
-        self.fill_widget.called.connect(self._on_fill)
         self.viewer.layers.events.inserted.connect(
             self.fill_widget.reset_choices
         )
@@ -87,6 +98,12 @@ class QtSkeletonCurator(QWidget):
         self.layout().addWidget(self.fill_widget.native)
         self.layout().addWidget(self.save_btn)
 
+    def _make_label_pyramid(self, labels):
+        # write each pyramid to its own zarr store so that layers from
+        # earlier runs keep their data
+        store = tempfile.mkdtemp(dir=self._pyramid_dir.name)
+        return make_label_pyramid(labels, store=store)
+
     def _update_image_data(self, event):
         # hacky way to get current image layers - ask Talley
         # how to improve...
@@ -117,10 +134,11 @@ class QtSkeletonCurator(QWidget):
 
         # make the layer with the skeleton
         self.viewer.add_labels(
-            skeletononized_im,
+            self._make_label_pyramid(skeletononized_im),
+            multiscale=True,
             name="skeletonize",
             properties=summary,
-            metadata={'skan_obj': skeleton_obj}
+            metadata={'skan_obj': skeleton_obj},
         )
 
 
@@ -144,11 +162,26 @@ class QtSkeletonCurator(QWidget):
             branch_type_3=branch_type_3,
             )
         pruned_im = np.asarray(pruned)
-        self.viewer.add_labels(pruned_im, properties = summary_pruned, name= 'prune')
+        self.viewer.add_labels(
+            self._make_label_pyramid(pruned_im),
+            multiscale=True,
+            properties=summary_pruned,
+            name='prune',
+        )
 
-    def _on_fill(self, function_output):
-        # pass the image to our skeletonize function
-        skeletononized_im, summary, skeleton_obj = function_output
+    def _on_fill(self, skeleton_layer: Labels, dilation_size: int = 3):
+        # the skeleton layers are multiscale, so fill the full resolution
+        # level. note that this loads the whole level into memory.
+        if skeleton_layer.multiscale:
+            skeleton_im = np.asarray(skeleton_layer.data[0])
+        else:
+            skeleton_im = np.asarray(skeleton_layer.data)
+
+        # pass the image to our fill function
+        skeletononized_im, summary, skeleton_obj = fill_skeleton_holes(
+            skeleton_im,
+            dilation_size=dilation_size,
+        )
         self.skeleton.update({'filled_skeleton': skeleton_obj})
 
         # Calculate the tortuosity of each branch
@@ -160,7 +193,12 @@ class QtSkeletonCurator(QWidget):
         )
         self.summary.update({'filled_skeleton': summary})
 
-        self.viewer.add_labels(skeletononized_im, name="filled_skeleton", properties=summary)
+        self.viewer.add_labels(
+            self._make_label_pyramid(skeletononized_im),
+            multiscale=True,
+            name="filled_skeleton",
+            properties=summary,
+        )
 
     def _on_save_summary(self):
         summary_key= 'filled_skeleton'
@@ -1,3 +1,4 @@
+import tempfile
 from typing import List
 
 import napari.layers
@@ -8,6 +9,8 @@ from napari.utils.events.containers import EventedList
 from qtpy.QtWidgets import QPushButton, QVBoxLayout, QWidget
 import skan
 
+from .utils import make_label_pyramid
+
 
 class QtSkeletonPruner(QWidget):
 
@@ -16,6 +19,10 @@ class QtSkeletonPruner(QWidget):
         self.setLayout(QVBoxLayout())
         self.viewer = napari_viewer
 
+        # the label pyramids are stored in a temporary directory that is
+        # removed with the widget
+        self._pyramid_dir = tempfile.TemporaryDirectory()
+
         # create combobox to select layer
         self.select_layer_widget = magicgui.magicgui(
             self._set_layer,
@@ -54,6 +61,12 @@ class QtSkeletonPruner(QWidget):
         self.layout().addWidget(self.table.native)
         self.layout().addWidget(self.prune_btn)
 
+    def _make_label_pyramid(self, labels):
+        # write each pyramid to its own zarr store so that layers from
+        # earlier runs keep their data
+        store = tempfile.mkdtemp(dir=self._pyramid_dir.name)
+        return make_label_pyramid(labels, store=store)
+
     @property
     def selected_layer(self) -> str:
         return self._selected_layer
@@ -120,9 +133,10 @@ class QtSkeletonPruner(QWidget):
             summary_pruned['index'] = np.arange(summary_pruned.shape[0]) + 1
             pruned_im = np.asarray(pruned)
             self.viewer.add_labels(
-                pruned_im,
+                self._make_label_pyramid(pruned_im),
+                multiscale=True,
                 properties=summary_pruned,
                 name='prune',
-                metadata={'skan_obj': pruned}
+                metadata={'skan_obj': pruned},
             )
 
@@ -1,5 +1,8 @@
-from typing import Tuple, Union
+from numbers import Integral
+import os
+from typing import List, Optional, Tuple, Union
 
+import dask.array as da
 from napari.types import ImageData, LabelsData
 import numpy as np
 import pandas as pd
@@ -94,3 +97,57 @@ def fill_skeleton_holes(
     filled_skeleton_summary = skan.summarize(filled_obj)
 
     return filled_skeleton_labels, filled_skeleton_summary, filled_obj
+
+
+def _max_coarsen(labels: da.Array, downscale: int, chunks: Tuple[int, ...]) -> da.Array:
+    # max-pool the last two (spatial) axes so that 1 px wide branches keep
+    # their ids. pad with background so the edge blocks are pooled too.
+    pad_width = [(0, 0)] * (labels.ndim - 2) + [
+        (0, -size % downscale) for size in labels.shape[-2:]
+    ]
+    padded = da.pad(labels, pad_width, mode='constant')
+
+    # align the chunks with the pooling blocks
+    factors = {ax: downscale for ax in range(labels.ndim - 2, labels.ndim)}
+    aligned_chunks = tuple(c * factors.get(ax, 1) for ax, c in enumerate(chunks))
+    padded = padded.rechunk(aligned_chunks)
+
+    return da.coarsen(np.max, padded, factors).rechunk(chunks)
+
+
+def make_label_pyramid(
+        labels: LabelsData,
+        store: Optional[str] = None,
+        chunk_size: int = 1024,
+        downscale: int = 2,
+) -> List[da.Array]:
+    """Make a lazy, chunked label pyramid for displaying large label images.
+
+    The last two axes are treated as the spatial axes and are chunked and
+    downsampled by max-pooling the label values, so that thin skeleton
+    branches keep their branch ids when zoomed out. Any leading axes are
+    kept at full size with a chunk size of 1. The coarsest level fits in
+    a single spatial chunk.
+
+    If a store path is given, each level is written to a zarr array in
+    ``<store>/<level>`` and read back lazily, so every level is only
+    computed once and each chunk is computed from a few chunks of the
+    previous level. Without a store, the levels are computed on read.
+    """
+    if labels.ndim < 2:
+        raise ValueError('labels should have at least 2 dimensions')
+    if not isinstance(downscale, Integral) or downscale < 2:
+        raise ValueError('downscale should be an integer of at least 2')
+
+    chunks = (1,) * (labels.ndim - 2) + (chunk_size, chunk_size)
+    pyramid = [da.asarray(labels).rechunk(chunks)]
+    while True:
+        if store is not None:
+            level_path = os.path.join(store, str(len(pyramid) - 1))
+            pyramid[-1].to_zarr(level_path, overwrite=True)
+            pyramid[-1] = da.from_zarr(level_path)
+        if max(pyramid[-1].shape[-2:]) <= chunk_size:
+            break
+        pyramid.append(_max_coarsen(pyramid[-1], downscale, chunks))
+
+    return pyramid